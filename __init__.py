@@ -1,36 +1,47 @@
 """The Kwatt integration."""
 import logging
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.storage import Store
 
 from .api import KwattApiClient
-from .const import CONF_CIC, DOMAIN, STORAGE_KEY, STORAGE_VERSION
+from .const import CONF_CIC, STORAGE_KEY, STORAGE_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = []  # Will add platforms later (sensor, climate, etc.)
 
+KwattConfigEntry = ConfigEntry[KwattApiClient]
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+
+async def async_setup_entry(hass: HomeAssistant, entry: KwattConfigEntry) -> bool:
     """Set up Kwatt from a config entry."""
     cic = entry.data[CONF_CIC]
 
     # Create storage for tokens
     store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
 
-    # Load stored tokens
-    stored_data = await store.async_load()
-
-    # Create API client
-    session = aiohttp_client.async_get_clientsession(hass)
+    # Load stored tokens, falling back to the ones paired in the config flow
+    stored_data = await store.async_load() or entry.data
+
+    # Create API client with its own connection pool for the Firebase and
+    # Quatt hosts, closed again when the entry is unloaded or setup fails
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=8,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+        )
+    )
+    entry.async_on_unload(session.close)
     api = KwattApiClient(cic, session, store)
 
     # Load tokens if they exist
-    if stored_data:
+    if stored_data.get("refresh_token"):
         api.load_tokens(
             stored_data.get("id_token"),
             stored_data.get("refresh_token"),
@@ -41,11 +52,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Authenticate (will use existing tokens if available, or do full auth)
     if not await api.authenticate():
         _LOGGER.error("Failed to authenticate with Kwatt API")
+        # on_unload callbacks don't run when setup returns False
+        await session.close()
         return False
 
-    # Store API client in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = api
+    # Tokens handed over by the config flow now live in the Store only
+    if "refresh_token" in entry.data:
+        await store.async_save(api.token_data())
+        hass.config_entries.async_update_entry(entry, data={CONF_CIC: cic})
+
+    api.start_token_refresh()
+    entry.async_on_unload(api.stop_token_refresh)
+
+    # Store API client on the config entry
+    entry.runtime_data = api
 
     # Forward setup to platforms
     if PLATFORMS:
@@ -54,14 +74,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: KwattConfigEntry) -> bool:
     """Unload a config entry."""
     if PLATFORMS:
-        unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    else:
-        unload_ok = True
-
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    return unload_ok
+    return True
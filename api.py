@@ -1,9 +1,15 @@
 """API client for Kwatt integration."""
 import asyncio
+import base64
 import logging
+import random
+import time
+from collections.abc import Coroutine
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     FIREBASE_ACCOUNT_INFO_URL,
@@ -23,12 +29,113 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 PAIRING_TIMEOUT = 60  # seconds to wait for button press
-PAIRING_CHECK_INTERVAL = 2  # seconds between checks
+PAIRING_CHECK_INTERVAL = 0.5  # seconds before the first re-check
+PAIRING_CHECK_INTERVAL_MAX = 8  # cap for the backoff between checks
+PAIRING_CHECK_BACKOFF = 1.6  # growth factor of the interval between checks
+PAIRING_CHECK_JITTER = 0.25  # max random seconds added to each wait
+TOKEN_REFRESH_MARGIN = 5 * 60  # seconds before id token expiry to refresh
+TOKEN_REFRESH_FALLBACK = 55 * 60  # refresh interval when expiry is unknown
+TOKEN_REFRESH_RETRY = 60  # seconds before retrying a failed background refresh
+TOKEN_REFRESH_RETRY_MAX = 30 * 60  # cap for the backoff between retries
+TOKEN_SAVE_DELAY = 10  # seconds to coalesce token updates before writing
+
+# Static request headers, built once
+FIREBASE_INSTALL_HEADERS = MappingProxyType({
+    "X-Android-Cert": GOOGLE_ANDROID_CERT,
+    "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
+    "x-firebase-client": GOOGLE_FIREBASE_CLIENT,
+    "x-goog-api-key": GOOGLE_API_KEY,
+})
+FIREBASE_REMOTE_CONFIG_HEADERS = MappingProxyType({
+    "X-Android-Cert": GOOGLE_ANDROID_CERT,
+    "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
+    "X-Goog-Api-Key": GOOGLE_API_KEY,
+    "X-Google-GFE-Can-Retry": "yes",
+    "X-Firebase-RC-Fetch-Type": "BASE/1",
+})
+FIREBASE_ANDROID_HEADERS = MappingProxyType({
+    "X-Android-Cert": GOOGLE_ANDROID_CERT,
+    "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
+    "X-Client-Version": "Android/Fallback/X24000001/FirebaseCore-Android",
+    "X-Firebase-GMPID": GOOGLE_APP_ID,
+    "X-Firebase-Client": GOOGLE_FIREBASE_CLIENT,
+})
+FIREBASE_TOKEN_HEADERS = MappingProxyType({
+    **FIREBASE_ANDROID_HEADERS,
+    "Content-Type": "application/json",
+})
+
+# Request URLs that don't depend on the CIC
+FIREBASE_SIGNUP_KEY_URL = f"{FIREBASE_SIGNUP_URL}?key={GOOGLE_API_KEY}"
+FIREBASE_ACCOUNT_INFO_KEY_URL = f"{FIREBASE_ACCOUNT_INFO_URL}?key={GOOGLE_API_KEY}"
+FIREBASE_TOKEN_KEY_URL = f"{FIREBASE_TOKEN_URL}?key={GOOGLE_API_KEY}"
+QUATT_ME_URL = f"{QUATT_API_BASE_URL}/me"
+QUATT_INSTALLATIONS_URL = f"{QUATT_API_BASE_URL}/me/installations"
+
+# Quatt API answers with these when the id token has expired
+TOKEN_EXPIRED_STATUSES = frozenset({401})
+# Reads also answer 403 for an expired token, other calls may mean the CIC
+TOKEN_REJECTED_STATUSES = frozenset({401, 403})
+# Success statuses for Quatt API calls that don't return data
+SUCCESS_STATUSES = frozenset({200, 201, 204})
+
+
+def _token_expires_in(token: str) -> float | None:
+    """Return seconds until a JWT expires, or None if it can't be read."""
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return claims["exp"] - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def _read_error(response: aiohttp.ClientResponse, limit: int = 512) -> str:
+    """Return the start of an error response body for logging."""
+    return (await response.content.read(limit)).decode(errors="replace")
+
+
+async def _run_concurrently(*steps: Coroutine[Any, Any, bool]) -> bool:
+    """Run auth steps concurrently, return whether all of them succeeded.
+
+    When one step raises the others are cancelled, so no request is left
+    running after authentication gave up.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(step) for step in steps]
+    except ExceptionGroup as err:
+        # Hand the first failure to the caller's aiohttp error handling
+        raise err.exceptions[0] from None
+    return all(task.result() for task in tasks)
 
 
 class KwattApiClient:
     """API client for Kwatt/Quatt."""
 
+    __slots__ = (
+        "cic",
+        "_session",
+        "_store",
+        "_cic_url",
+        "_request_pair_url",
+        "_id_token_value",
+        "_auth_headers",
+        "_refresh_token",
+        "_fid",
+        "_firebase_auth_token",
+        "_installation_id",
+        "_pairing_completed",
+        "_pairing",
+        "_auto_refresh",
+        "_refresh_handle",
+        "_refresh_task",
+        "_refresh_retry_delay",
+        "_refresh_lock",
+    )
+
     def __init__(
         self,
         cic: str,
@@ -39,12 +146,32 @@ class KwattApiClient:
         self.cic = cic
         self._session = session
         self._store = store
-        self._id_token: str | None = None
+        self._cic_url = f"{QUATT_API_BASE_URL}/me/cic/{cic}"
+        self._request_pair_url = f"{self._cic_url}/requestPair"
+        self._id_token_value: str | None = None
+        self._auth_headers: dict[str, str] = {}
         self._refresh_token: str | None = None
         self._fid: str | None = None
         self._firebase_auth_token: str | None = None
         self._installation_id: str | None = None
         self._pairing_completed: bool = False
+        self._pairing: bool = False
+        self._auto_refresh: bool = False
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_retry_delay: float = TOKEN_REFRESH_RETRY
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def _id_token(self) -> str | None:
+        """Return the Firebase id token."""
+        return self._id_token_value
+
+    @_id_token.setter
+    def _id_token(self, token: str | None) -> None:
+        """Set the Firebase id token and the matching Authorization header."""
+        self._id_token_value = token
+        self._auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
 
     def load_tokens(
         self,
@@ -59,92 +186,199 @@ class KwattApiClient:
         if id_token:
             _LOGGER.debug("Tokens loaded from storage")
 
-    async def _save_tokens(self) -> None:
-        """Save tokens to storage."""
-        if self._store:
-            await self._store.async_save({
-                "id_token": self._id_token,
-                "refresh_token": self._refresh_token,
-                "installation_id": self._installation_id,
-            })
-            _LOGGER.debug("Tokens saved to storage")
+    def start_token_refresh(self) -> None:
+        """Keep the id token fresh by refreshing it shortly before it expires."""
+        self._auto_refresh = True
+        self._schedule_token_refresh()
+
+    def stop_token_refresh(self) -> None:
+        """Stop refreshing the id token in the background."""
+        self._auto_refresh = False
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _schedule_token_refresh(self, delay: float | None = None) -> None:
+        """Schedule the next background refresh.
+
+        Without an explicit delay it is derived from the id token expiry.
+        """
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if not self._auto_refresh or not self._id_token:
+            return
+
+        if delay is None:
+            expires_in = _token_expires_in(self._id_token)
+            if expires_in is None:
+                delay = TOKEN_REFRESH_FALLBACK
+            else:
+                delay = max(expires_in - TOKEN_REFRESH_MARGIN, 0)
+        _LOGGER.debug("Next token refresh in %.0f seconds", delay)
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_scheduled_refresh
+        )
+
+    def _start_scheduled_refresh(self) -> None:
+        """Run a scheduled token refresh."""
+        self._refresh_handle = None
+        self._refresh_task = asyncio.create_task(self._async_scheduled_refresh())
+
+    async def _async_scheduled_refresh(self) -> None:
+        """Refresh the id token in the background."""
+        try:
+            # A successful refresh schedules the next one itself
+            if await self._refresh_rejected_token(self._id_token):
+                return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # Network problem or server error, worth retrying with backoff
+            _LOGGER.warning(
+                "Background token refresh failed, retrying in %.0f seconds: %s",
+                self._refresh_retry_delay,
+                err,
+            )
+            self._schedule_token_refresh(self._refresh_retry_delay)
+            self._refresh_retry_delay = min(
+                self._refresh_retry_delay * 2, TOKEN_REFRESH_RETRY_MAX
+            )
+            return
+
+        # Refresh token rejected, retrying won't help
+        _LOGGER.error("Refresh token rejected, stopping background token refresh")
+        self._auto_refresh = False
+
+    def token_data(self) -> dict[str, str | None]:
+        """Return the tokens to persist, in the format load_tokens expects."""
+        return {
+            "id_token": self._id_token,
+            "refresh_token": self._refresh_token,
+            "installation_id": self._installation_id,
+        }
+
+    def _save_tokens(self) -> None:
+        """Schedule saving tokens to storage, coalescing rapid updates."""
+        # Tokens of a new user are only worth keeping once pairing completed
+        if self._store and not self._pairing:
+            self._store.async_delay_save(self.token_data, TOKEN_SAVE_DELAY)
+            _LOGGER.debug("Tokens scheduled to be saved to storage")
 
     async def authenticate(self) -> bool:
         """Authenticate with Firebase and Quatt API."""
         try:
-            # Check if we have existing tokens
-            if self._id_token and self._refresh_token:
+            # Stored refresh token: skip signup and pairing entirely
+            if self._refresh_token:
                 _LOGGER.debug("Using existing tokens")
-                # Try to validate token by getting CIC data
-                cic_data = await self.get_cic_data()
-
-                if cic_data:
-                    _LOGGER.info("Successfully authenticated with existing tokens")
-                    return True
-
-                # Token might be expired, try refresh
-                _LOGGER.debug("Existing token failed, attempting refresh")
-                if await self.refresh_token():
-                    await self._save_tokens()
-                    # Verify refreshed token works
-                    cic_data = await self.get_cic_data()
-                    if cic_data:
-                        _LOGGER.info("Successfully authenticated with refreshed token")
+                # Without an id token refresh first, otherwise get_cic_data
+                # refreshes by itself when the stored id token is rejected
+                try:
+                    if (
+                        self._id_token or await self.refresh_token()
+                    ) and await self.get_cic_data():
+                        _LOGGER.info("Successfully authenticated with existing tokens")
                         return True
+                except aiohttp.ClientResponseError as err:
+                    if err.status not in TOKEN_REJECTED_STATUSES:
+                        raise
 
-                # Refresh failed, fall through to full auth
+                # Tokens no longer valid, fall through to full auth
                 _LOGGER.warning("Token refresh failed, performing full authentication")
 
             # Full authentication flow (needed for initial setup or when tokens fail)
-            # Step 1: Get Firebase Installation ID
-            if not await self._get_firebase_installation():
-                return False
-
-            # Step 2: Fetch Firebase Remote Config
-            if not await self._firebase_fetch():
-                return False
-
-            # Step 3: Sign up new user (anonymous)
-            if not await self._signup_new_user():
-                return False
-
-            # Step 4: Get account information
-            if not await self._get_account_info():
-                return False
-
-            # Step 5: Update user profile
-            if not await self._update_user_profile():
+            self._pairing = True
+
+            # Steps 1-4: Firebase installation (+ remote config) and anonymous
+            # signup (+ account info) don't depend on each other, run them together
+            if not await _run_concurrently(
+                self._register_installation(),
+                self._register_user(),
+            ):
                 return False
 
-            # Step 6: Request pairing with CIC
-            if not await self._request_pair():
+            # Steps 5-6: Update user profile and request pairing with CIC
+            if not await _run_concurrently(
+                self._update_user_profile(),
+                self._request_pair(),
+            ):
                 return False
 
             # Step 7: Wait for user to press button on CIC and verify pairing
             if not await self._wait_for_pairing():
                 return False
 
-            # Step 8: Get installation ID
-            if not await self._get_installation_id():
+            # Step 8: Get installation ID, unless already known from stored
+            # tokens (re-pairing the same CIC keeps its installation)
+            if self._installation_id is None and not await self._get_installation_id():
                 return False
 
             # Save tokens after successful authentication
-            await self._save_tokens()
+            self._pairing = False
+            self._save_tokens()
 
             return True
-        except Exception as err:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Authentication failed: %s", err)
             return False
+        finally:
+            self._pairing = False
+
+    async def _refresh_rejected_token(self, rejected_token: str | None) -> bool:
+        """Refresh the id token unless it changed since it was rejected.
+
+        Concurrent callers share one refresh instead of each starting their own.
+        """
+        async with self._refresh_lock:
+            if self._id_token != rejected_token:
+                _LOGGER.debug("Token already refreshed")
+                return True
+            return await self.refresh_token()
+
+    async def _authed_request(
+        self,
+        method: str,
+        url: str,
+        rejected_statuses: frozenset[int] = TOKEN_EXPIRED_STATUSES,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        """Make an authenticated Quatt API request.
+
+        When the id token is rejected with one of rejected_statuses it is
+        refreshed and the request is retried once, so token expiry is
+        invisible to callers.
+        """
+        token = self._id_token
+        response = await self._session.request(
+            method, url, headers=self._auth_headers, **kwargs
+        )
+        if response.status in rejected_statuses:
+            _LOGGER.debug("Got %s, attempting to refresh token", response.status)
+            try:
+                refreshed = await self._refresh_rejected_token(token)
+            except BaseException:
+                response.release()
+                raise
+            if refreshed:
+                response.release()
+                response = await self._session.request(
+                    method, url, headers=self._auth_headers, **kwargs
+                )
+        return response
+
+    async def _register_installation(self) -> bool:
+        """Get Firebase Installation ID and fetch Firebase Remote Config."""
+        return (
+            await self._get_firebase_installation() and await self._firebase_fetch()
+        )
+
+    async def _register_user(self) -> bool:
+        """Sign up new anonymous user and get its account information."""
+        return await self._signup_new_user() and await self._get_account_info()
 
     async def _get_firebase_installation(self) -> bool:
         """Get Firebase Installation ID and auth token."""
-        headers = {
-            "X-Android-Cert": GOOGLE_ANDROID_CERT,
-            "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
-            "x-firebase-client": GOOGLE_FIREBASE_CLIENT,
-            "x-goog-api-key": GOOGLE_API_KEY,
-        }
-
         payload = {
             "fid": GOOGLE_APP_INSTANCE_ID,
             "appId": GOOGLE_APP_ID,
@@ -152,25 +386,21 @@ class KwattApiClient:
             "sdkVersion": "a:19.0.1",
         }
 
-        try:
-            async with self._session.post(
-                FIREBASE_INSTALLATIONS_URL,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self._fid = data.get("fid")
-                    auth_token = data.get("authToken", {})
-                    self._firebase_auth_token = auth_token.get("token")
-                    _LOGGER.debug("Firebase installation successful")
-                    return True
-                _LOGGER.error(
-                    "Firebase installation failed: %s", await response.text()
-                )
-                return False
-        except Exception as err:
-            _LOGGER.error("Firebase installation error: %s", err)
+        async with self._session.post(
+            FIREBASE_INSTALLATIONS_URL,
+            json=payload,
+            headers=FIREBASE_INSTALL_HEADERS,
+        ) as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                self._fid = data.get("fid")
+                auth_token = data.get("authToken", {})
+                self._firebase_auth_token = auth_token.get("token")
+                _LOGGER.debug("Firebase installation successful")
+                return True
+            _LOGGER.error(
+                "Firebase installation failed: %s", await _read_error(response)
+            )
             return False
 
     async def _firebase_fetch(self) -> bool:
@@ -179,12 +409,8 @@ class KwattApiClient:
             return False
 
         headers = {
-            "X-Android-Cert": GOOGLE_ANDROID_CERT,
-            "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
-            "X-Goog-Api-Key": GOOGLE_API_KEY,
-            "X-Google-GFE-Can-Retry": "yes",
+            **FIREBASE_REMOTE_CONFIG_HEADERS,
             "X-Goog-Firebase-Installations-Auth": self._firebase_auth_token,
-            "X-Firebase-RC-Fetch-Type": "BASE/1",
         }
 
         payload = {
@@ -203,53 +429,35 @@ class KwattApiClient:
             "packageName": GOOGLE_ANDROID_PACKAGE,
         }
 
-        try:
-            async with self._session.post(
-                FIREBASE_REMOTE_CONFIG_URL,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    _LOGGER.debug("Firebase remote config fetched successfully")
-                    return True
-                _LOGGER.error(
-                    "Firebase remote config fetch failed: %s", await response.text()
-                )
-                return False
-        except Exception as err:
-            _LOGGER.error("Firebase remote config fetch error: %s", err)
+        async with self._session.post(
+            FIREBASE_REMOTE_CONFIG_URL,
+            json=payload,
+            headers=headers,
+        ) as response:
+            if response.status == 200:
+                _LOGGER.debug("Firebase remote config fetched successfully")
+                return True
+            _LOGGER.error(
+                "Firebase remote config fetch failed: %s", await _read_error(response)
+            )
             return False
 
     async def _signup_new_user(self) -> bool:
         """Sign up new anonymous user with Firebase."""
-        headers = {
-            "X-Android-Cert": GOOGLE_ANDROID_CERT,
-            "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
-            "X-Client-Version": "Android/Fallback/X24000001/FirebaseCore-Android",
-            "X-Firebase-GMPID": GOOGLE_APP_ID,
-            "X-Firebase-Client": GOOGLE_FIREBASE_CLIENT,
-        }
-
         payload = {"clientType": "CLIENT_TYPE_ANDROID"}
 
-        url = f"{FIREBASE_SIGNUP_URL}?key={GOOGLE_API_KEY}"
-
-        try:
-            async with self._session.post(
-                url,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self._id_token = data.get("idToken")
-                    self._refresh_token = data.get("refreshToken")
-                    _LOGGER.debug("User signup successful")
-                    return True
-                _LOGGER.error("User signup failed: %s", await response.text())
-                return False
-        except Exception as err:
-            _LOGGER.error("User signup error: %s", err)
+        async with self._session.post(
+            FIREBASE_SIGNUP_KEY_URL,
+            json=payload,
+            headers=FIREBASE_ANDROID_HEADERS,
+        ) as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                self._id_token = data.get("idToken")
+                self._refresh_token = data.get("refreshToken")
+                _LOGGER.debug("User signup successful")
+                return True
+            _LOGGER.error("User signup failed: %s", await _read_error(response))
             return False
 
     async def _get_account_info(self) -> bool:
@@ -257,31 +465,17 @@ class KwattApiClient:
         if not self._id_token:
             return False
 
-        headers = {
-            "X-Android-Cert": GOOGLE_ANDROID_CERT,
-            "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
-            "X-Client-Version": "Android/Fallback/X24000001/FirebaseCore-Android",
-            "X-Firebase-GMPID": GOOGLE_APP_ID,
-            "X-Firebase-Client": GOOGLE_FIREBASE_CLIENT,
-        }
-
         payload = {"idToken": self._id_token}
 
-        url = f"{FIREBASE_ACCOUNT_INFO_URL}?key={GOOGLE_API_KEY}"
-
-        try:
-            async with self._session.post(
-                url,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    _LOGGER.debug("Account info retrieved successfully")
-                    return True
-                _LOGGER.error("Get account info failed: %s", await response.text())
-                return False
-        except Exception as err:
-            _LOGGER.error("Get account info error: %s", err)
+        async with self._session.post(
+            FIREBASE_ACCOUNT_INFO_KEY_URL,
+            json=payload,
+            headers=FIREBASE_ANDROID_HEADERS,
+        ) as response:
+            if response.status == 200:
+                _LOGGER.debug("Account info retrieved successfully")
+                return True
+            _LOGGER.error("Get account info failed: %s", await _read_error(response))
             return False
 
     async def _update_user_profile(self) -> bool:
@@ -289,25 +483,17 @@ class KwattApiClient:
         if not self._id_token:
             return False
 
-        headers = {"Authorization": f"Bearer {self._id_token}"}
         payload = {"firstName": "HomeAssistant", "lastName": "User"}
-        url = f"{QUATT_API_BASE_URL}/me"
 
-        try:
-            async with self._session.put(
-                url,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status in (200, 201):
-                    _LOGGER.debug("User profile updated")
-                    return True
-                _LOGGER.error(
-                    "User profile update failed: %s", await response.text()
-                )
-                return False
-        except Exception as err:
-            _LOGGER.error("User profile update error: %s", err)
+        async with await self._authed_request(
+            "PUT", QUATT_ME_URL, json=payload
+        ) as response:
+            if response.status in SUCCESS_STATUSES:
+                _LOGGER.debug("User profile updated")
+                return True
+            _LOGGER.error(
+                "User profile update failed: %s", await _read_error(response)
+            )
             return False
 
     async def _request_pair(self) -> bool:
@@ -315,23 +501,15 @@ class KwattApiClient:
         if not self._id_token:
             return False
 
-        headers = {"Authorization": f"Bearer {self._id_token}"}
         payload = {}
-        url = f"{QUATT_API_BASE_URL}/me/cic/{self.cic}/requestPair"
 
-        try:
-            async with self._session.post(
-                url,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status in (200, 201, 204):
-                    _LOGGER.debug("Pairing request successful")
-                    return True
-                _LOGGER.error("Pairing request failed: %s", await response.text())
-                return False
-        except Exception as err:
-            _LOGGER.error("Pairing request error: %s", err)
+        async with await self._authed_request(
+            "POST", self._request_pair_url, json=payload
+        ) as response:
+            if response.status in SUCCESS_STATUSES:
+                _LOGGER.debug("Pairing request successful")
+                return True
+            _LOGGER.error("Pairing request failed: %s", await _read_error(response))
             return False
 
     async def _wait_for_pairing(self) -> bool:
@@ -341,17 +519,17 @@ class KwattApiClient:
 
         _LOGGER.info("Waiting for user to press button on CIC device...")
 
-        headers = {"Authorization": f"Bearer {self._id_token}"}
-        url = f"{QUATT_API_BASE_URL}/me"
+        # Poll for up to PAIRING_TIMEOUT seconds, backing off between checks
+        start_time = time.monotonic()
+        delay = PAIRING_CHECK_INTERVAL
 
-        # Poll for up to PAIRING_TIMEOUT seconds
-        start_time = asyncio.get_event_loop().time()
-
-        while (asyncio.get_event_loop().time() - start_time) < PAIRING_TIMEOUT:
+        while time.monotonic() - start_time < PAIRING_TIMEOUT:
             try:
-                async with self._session.get(url, headers=headers) as response:
+                async with await self._authed_request(
+                    "GET", QUATT_ME_URL, TOKEN_REJECTED_STATUSES
+                ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=orjson.loads)
                         # Check if CIC is in the user's account
                         result = data.get("result", {})
                         cic_ids = result.get("cicIds", [])
@@ -363,12 +541,13 @@ class KwattApiClient:
 
                         _LOGGER.debug("Pairing not yet completed, waiting...")
                     else:
-                        _LOGGER.warning("Failed to check pairing status: %s", await response.text())
-            except Exception as err:
+                        _LOGGER.warning("Failed to check pairing status: %s", await _read_error(response))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
                 _LOGGER.warning("Error checking pairing status: %s", err)
 
             # Wait before checking again
-            await asyncio.sleep(PAIRING_CHECK_INTERVAL)
+            await asyncio.sleep(delay + random.uniform(0, PAIRING_CHECK_JITTER))
+            delay = min(delay * PAIRING_CHECK_BACKOFF, PAIRING_CHECK_INTERVAL_MAX)
 
         _LOGGER.error("Pairing timeout - user did not press button within %s seconds", PAIRING_TIMEOUT)
         return False
@@ -384,53 +563,55 @@ class KwattApiClient:
             _LOGGER.error("No installations found")
             return False
 
-        # Get the first installation (or match by CIC if available)
-        for installation in installations:
-            external_id = installation.get("externalId")
-            if external_id and external_id.startswith("INS-"):
-                self._installation_id = external_id
-                _LOGGER.info("Installation ID: %s", self._installation_id)
-                return True
+        # Get the first installation with a valid external ID
+        self._installation_id = next(
+            (
+                installation["externalId"]
+                for installation in installations
+                if (installation.get("externalId") or "").startswith("INS-")
+            ),
+            None,
+        )
+
+        if self._installation_id is None:
+            _LOGGER.error("No valid installation ID found")
+            return False
 
-        _LOGGER.error("No valid installation ID found")
-        return False
+        _LOGGER.info("Installation ID: %s", self._installation_id)
+        return True
 
     async def refresh_token(self) -> bool:
-        """Refresh the authentication token."""
+        """Refresh the authentication token.
+
+        Returns False when the refresh token is rejected and raises
+        aiohttp.ClientResponseError on server errors.
+        """
         if not self._refresh_token:
             return False
 
-        headers = {
-            "X-Android-Cert": GOOGLE_ANDROID_CERT,
-            "X-Android-Package": GOOGLE_ANDROID_PACKAGE,
-            "X-Client-Version": "Android/Fallback/X24000001/FirebaseCore-Android",
-            "X-Firebase-GMPID": GOOGLE_APP_ID,
-            "X-Firebase-Client": GOOGLE_FIREBASE_CLIENT,
-        }
-
         payload = {
             "grantType": "refresh_token",
             "refreshToken": self._refresh_token,
         }
 
-        url = f"{FIREBASE_TOKEN_URL}?key={GOOGLE_API_KEY}"
-
-        try:
-            async with self._session.post(
-                url,
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self._id_token = data.get("id_token")
-                    self._refresh_token = data.get("refresh_token")
-                    _LOGGER.debug("Token refresh successful")
-                    return True
-                _LOGGER.error("Token refresh failed: %s", await response.text())
-                return False
-        except Exception as err:
-            _LOGGER.error("Token refresh error: %s", err)
+        async with self._session.post(
+            FIREBASE_TOKEN_KEY_URL,
+            data=orjson.dumps(payload),
+            headers=FIREBASE_TOKEN_HEADERS,
+        ) as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                self._id_token = data.get("id_token")
+                self._refresh_token = data.get("refresh_token")
+                _LOGGER.debug("Token refresh successful")
+                self._save_tokens()
+                self._refresh_retry_delay = TOKEN_REFRESH_RETRY
+                self._schedule_token_refresh()
+                return True
+            # Server side problems are transient, raise so callers can retry
+            if response.status >= 500:
+                response.raise_for_status()
+            _LOGGER.error("Token refresh failed: %s", await _read_error(response))
             return False
 
     async def get_installations(self) -> list[dict[str, Any]]:
@@ -438,45 +619,22 @@ class KwattApiClient:
         if not self._id_token:
             return []
 
-        headers = {"Authorization": f"Bearer {self._id_token}"}
-        url = f"{QUATT_API_BASE_URL}/me/installations"
-
-        try:
-            async with self._session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("result", [])
-                _LOGGER.error("Get installations failed: %s", await response.text())
-                return []
-        except Exception as err:
-            _LOGGER.error("Get installations error: %s", err)
+        async with await self._authed_request(
+            "GET", QUATT_INSTALLATIONS_URL, TOKEN_REJECTED_STATUSES
+        ) as response:
+            if response.status == 200:
+                data = await response.json(loads=orjson.loads)
+                return data.get("result", [])
+            _LOGGER.error("Get installations failed: %s", await _read_error(response))
             return []
 
-    async def get_cic_data(self, retry_on_403: bool = True) -> dict[str, Any] | None:
+    async def get_cic_data(self) -> dict[str, Any] | None:
         """Get CIC device data."""
         if not self._id_token:
             return None
 
-        headers = {"Authorization": f"Bearer {self._id_token}"}
-        url = f"{QUATT_API_BASE_URL}/me/cic/{self.cic}"
-
-        try:
-            async with self._session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-
-                # Handle 403 Forbidden - token might be expired
-                if response.status == 403 and retry_on_403:
-                    _LOGGER.warning("Got 403, attempting to refresh token")
-                    if await self.refresh_token():
-                        await self._save_tokens()
-                        # Retry once with new token (prevent infinite loop with retry_on_403=False)
-                        return await self.get_cic_data(retry_on_403=False)
-                    _LOGGER.error("Token refresh failed after 403")
-                    return None
-
-                _LOGGER.error("Get CIC data failed with status %s: %s", response.status, await response.text())
-                return None
-        except Exception as err:
-            _LOGGER.error("Get CIC data error: %s", err)
-            return None
+        async with await self._authed_request(
+            "GET", self._cic_url, TOKEN_REJECTED_STATUSES
+        ) as response:
+            response.raise_for_status()
+            return await response.json(loads=orjson.loads)
@@ -1,6 +1,7 @@
 """Config flow for Kwatt integration."""
 import logging
 import pathlib
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -15,10 +16,13 @@ from .const import CONF_CIC, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# "CIC-" followed by the device ID (letters, digits and dashes)
+CIC_PATTERN = re.compile(r"CIC-[A-Za-z0-9][A-Za-z0-9-]{3,63}")
+
 
 def validate_cic(cic: str) -> bool:
     """Validate CIC format."""
-    return cic.startswith("CIC-") and len(cic) > 4
+    return CIC_PATTERN.fullmatch(cic) is not None
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
@@ -30,7 +34,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     # Validate CIC format
     if not validate_cic(cic):
-        raise InvalidCIC("CIC must start with 'CIC-'")
+        raise InvalidCIC("CIC must be 'CIC-' followed by the device ID")
 
     # Create API client and authenticate
     session = aiohttp_client.async_get_clientsession(hass)
@@ -108,11 +112,13 @@ class KwattConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if not await api.authenticate():
                     errors["base"] = "pairing_timeout"
                 else:
-                    # Pairing successful, create entry
+                    # Pairing successful, create entry with the paired tokens
+                    # so setup doesn't have to pair again
                     return self.async_create_entry(
                         title=f"Kwatt {self._cic}",
                         data={
                             CONF_CIC: self._cic,
+                            **api.token_data(),
                         },
                     )
             except Exception:  # pylint: disable=broad-except